@@ -308,9 +308,10 @@ pub fn parse_file(ttpython: &TurnipTextPython<'_>, path: &std::path::Path) -> an
         })?);
     }
 
+    // Tokens are generated on demand as the interpreter consumes them
     let tokens = units_to_tokens(units);
 
-    match interp_data(&ttpython, &data, tokens.into_iter()) {
+    match interp_data(&ttpython, &data, tokens) {
         Ok(root) => Ok(root),
         Err(err) => {
             display_cli_feedback(&data, &err);
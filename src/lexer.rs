@@ -57,7 +57,13 @@ impl LexerPrefixSeq {
         L: CharStream<P>,
         L: Lexer<Token = Unit, State = P>,
     {
-        Self::try_from_char2(ch, stream.peek_at(&stream.consumed(state, 1)))
+        // Only `\r` and `r` can start a two-character sequence, so don't peek at the next character for anything else.
+        // This runs at the start of every unit, and most units start with plain text.
+        let ch2 = match ch {
+            '\r' | 'r' => stream.peek_at(&stream.consumed(state, 1)),
+            _ => None,
+        };
+        Self::try_from_char2(ch, ch2)
     }
 }
 
@@ -315,28 +321,37 @@ pub enum TTToken {
     // /// `%` character not preceded by a backslash
     // Percent(P),
 }
-pub fn units_to_tokens(units: Vec<Unit>) -> Vec<TTToken> {
-    let mut toks = vec![];
-    let mut i = 0;
-    while i < units.len() {
+/// Lazily convert a stream of [Unit]s to [TTToken]s, see [UnitsToTokens]
+pub fn units_to_tokens<I: IntoIterator<Item = Unit>>(units: I) -> UnitsToTokens<I::IntoIter> {
+    let mut units = units.into_iter().fuse();
+    let lookahead = [units.next(), units.next(), units.next()];
+    UnitsToTokens { units, lookahead }
+}
+
+/// Iterator which combines [Unit]s into [TTToken]s as they are requested.
+///
+/// Keeps a fixed window of the next three units to peek at, instead of indexing into a
+/// fully materialized `Vec<Unit>` and collecting all tokens into another `Vec`.
+pub struct UnitsToTokens<I: Iterator<Item = Unit>> {
+    units: std::iter::Fuse<I>,
+    lookahead: [Option<Unit>; 3],
+}
+impl<I: Iterator<Item = Unit>> Iterator for UnitsToTokens<I> {
+    type Item = TTToken;
+
+    fn next(&mut self) -> Option<Self::Item> {
         let (tok, n_consumed) = TTToken::units_to_token((
-            &units[i],
-            if i + 1 < units.len() {
-                Some(&units[i + 1])
-            } else {
-                None
-            },
-            if i + 2 < units.len() {
-                Some(&units[i + 2])
-            } else {
-                None
-            },
+            self.lookahead[0].as_ref()?,
+            self.lookahead[1].as_ref(),
+            self.lookahead[2].as_ref(),
         ));
         assert!(n_consumed > 0);
-        toks.push(tok);
-        i += n_consumed;
+        for _ in 0..n_consumed {
+            self.lookahead.rotate_left(1);
+            self.lookahead[2] = self.units.next();
+        }
+        Some(tok)
     }
-    toks
 }
 
 impl TTToken {
@@ -426,18 +441,12 @@ impl TTToken {
             Backslash(_) => "\\",
             // This is an odd case - Newline should have semantic meaning and not be embedded in text
             Newline(_) => "Newline should not be stringified",
-            Escaped(_, escaped) => match escaped {
-                // This is an odd case - Escaped(Newline) should have semantic meaning
-                Escapable::Newline => {
-                    panic!("EscapedNewline should have semantic meaning and not be stringified")
-                }
-                Escapable::Backslash => "\\",
-                Escapable::SqrOpen => "[",
-                Escapable::SqrClose => "]",
-                Escapable::SqgOpen => "{",
-                Escapable::SqgClose => "}",
-                Escapable::Hash => "#",
-            },
+            // This is an odd case - Escaped(Newline) should have semantic meaning
+            Escaped(_, Escapable::Newline) => {
+                panic!("EscapedNewline should have semantic meaning and not be stringified")
+            }
+            // All other escapes use the shared table in [Escapable::stringify]
+            Escaped(_, escaped) => escaped.stringify(),
             RawScopeOpen(span, _)
             | CodeOpen(span, _)
             | CodeClose(span, _)
@@ -35,7 +35,8 @@ impl PyTypeclass for BlockNode {
     const NAME: &'static str = "BlockNode";
 
     fn fits_typeclass(obj: &PyAny) -> PyResult<bool> {
-        let x = obj.is_instance_of::<BlockScope>()? || obj.is_instance_of::<Paragraph>()?;
+        // Check the most common case first - most blocks are paragraphs
+        let x = obj.is_instance_of::<Paragraph>()? || obj.is_instance_of::<BlockScope>()?;
         Ok(x)
     }
 }
@@ -47,9 +48,10 @@ impl PyTypeclass for InlineNode {
     const NAME: &'static str = "InlineNode";
 
     fn fits_typeclass(obj: &PyAny) -> PyResult<bool> {
-        let x = obj.is_instance_of::<InlineScope>()?
-            || obj.is_instance_of::<RawText>()?
-            || obj.is_instance_of::<UnescapedText>()?;
+        // Check the most common case first - most inline content is plain text
+        let x = obj.is_instance_of::<UnescapedText>()?
+            || obj.is_instance_of::<InlineScope>()?
+            || obj.is_instance_of::<RawText>()?;
         Ok(x)
     }
 }
@@ -106,6 +108,11 @@ impl UnescapedText {
 #[pyclass(sequence)]
 #[derive(Debug, Clone)]
 pub struct Sentence(pub PyTypeclassList<InlineNode>);
+impl Sentence {
+    pub fn push_tc_node(&mut self, py: Python, node: &PyTcRef<InlineNode>) -> PyResult<()> {
+        self.0.append_tc(py, node)
+    }
+}
 #[pymethods]
 impl Sentence {
     #[new]
@@ -241,6 +248,9 @@ impl InlineScope {
             children: PyTypeclassList::new(py),
         }
     }
+    pub fn push_tc_node(&mut self, py: Python, node: &PyTcRef<InlineNode>) -> PyResult<()> {
+        self.children.append_tc(py, node)
+    }
 }
 #[pymethods]
 impl InlineScope {
@@ -275,9 +285,12 @@ impl EvalBracketResult {
         // Python picks up leading whitespace as an incorrect indent
         let code = code.trim();
         let raw_res = py.eval(code, Some(globals), None)?;
-        let res = if let Ok(val) = PyTcRef::of(raw_res) {
+        // Most code evaluates to plain values, so check the typeclasses with try_of()
+        // instead of building (and throwing away) a PyTypeError for each failed check.
+        // The owner checks can raise (e.g. if str() isn't valid UTF-8) - treat that as "doesn't fit".
+        let res = if let Ok(Some(val)) = PyTcRef::try_of(raw_res) {
             EvalBracketResult::Inline(val)
-        } else if let Ok(val) = PyTcRef::of(raw_res) {
+        } else if let Ok(Some(val)) = PyTcRef::try_of(raw_res) {
             EvalBracketResult::Block(val)
         } else {
             EvalBracketResult::Other(raw_res.str()?.into_py(py))
@@ -8,7 +8,7 @@ use thiserror::Error;
 
 use crate::{
     lexer::{Escapable, TTToken},
-    python::{interop::*, typeclass::PyTcRef, TurnipTextPython},
+    python::{interop::*, typeclass::PyTcRef},
     util::ParseSpan,
 };
 
@@ -28,13 +28,8 @@ pub struct InterpState<'a> {
     data: &'a str,
 }
 impl<'a> InterpState<'a> {
-    pub fn new<'interp>(
-        ttpython: &'a TurnipTextPython<'interp>,
-        data: &'a str,
-    ) -> InterpResult<Self> {
-        let root = ttpython.with_gil(|py, _| {
-            Py::new(py, BlockScope::new_rs(py, None)).err_as_interp_internal(py)
-        })?;
+    pub fn new(py: Python, data: &'a str) -> InterpResult<Self> {
+        let root = Py::new(py, BlockScope::new_rs(py, None)).err_as_interp_internal(py)?;
         Ok(Self {
             block_state: InterpBlockState::ReadyForNewBlock,
             comment_state: None,
@@ -149,18 +144,19 @@ pub(crate) enum InlineNodeToCreate {
 }
 impl InlineNodeToCreate {
     fn to_py_intern(self, py: Python) -> PyResult<PyTcRef<InlineNode>> {
+        // Each node is created here as an InlineNode type, so it doesn't need checking against the typeclass
         let node = match self {
             InlineNodeToCreate::UnescapedText(s) => {
                 let val = Py::new(py, UnescapedText::new_rs(py, s.as_str()))?;
-                PyTcRef::of(val.as_ref(py))?
+                PyTcRef::of_unchecked(val.as_ref(py))
             }
             InlineNodeToCreate::RawText(owner, s) => {
                 let val = Py::new(py, RawText::new_rs(py, owner, s.as_str()))?;
-                PyTcRef::of(val.as_ref(py))?
+                PyTcRef::of_unchecked(val.as_ref(py))
             }
             InlineNodeToCreate::UnescapedPyString(s) => {
                 let val = Py::new(py, UnescapedText::new(s))?;
-                PyTcRef::of(val.as_ref(py))?
+                PyTcRef::of_unchecked(val.as_ref(py))
             }
         };
         Ok(node)
@@ -249,42 +245,38 @@ impl<T> MapInterpResult<T> for PyResult<T> {
 }
 
 impl<'a> InterpState<'a> {
-    pub fn handle_token<'interp>(
-        &mut self,
-        ttpython: &TurnipTextPython<'interp>,
-        tok: TTToken,
-    ) -> InterpResult<()> {
-        ttpython.with_gil(|py, globals| {
-            let transitions = self.mutate_and_find_transitions(py, globals, tok)?;
-            self.handle_transition(py, globals, transitions)
-        })
+    /// Handle a single token.
+    ///
+    /// The caller is expected to hold the GIL for the whole token stream (see [crate::python::interp_data])
+    /// instead of re-acquiring it for every token.
+    pub fn handle_token(&mut self, py: Python, globals: &PyDict, tok: TTToken) -> InterpResult<()> {
+        let transitions = self.mutate_and_find_transitions(py, globals, tok)?;
+        self.handle_transition(py, globals, transitions)
     }
 
-    pub fn finalize<'interp>(&mut self, ttpython: &TurnipTextPython<'interp>) -> InterpResult<()> {
-        ttpython.with_gil(|py, globals| {
-            let transitions = match &mut self.block_state {
-                InterpBlockState::ReadyForNewBlock => (None, None),
-                InterpBlockState::WritingPara(state) => state.finalize(py)?,
-                InterpBlockState::BuildingBlockLevelCode { code_start, .. } => {
-                    return Err(InterpError::EndedInsideCode {
-                        code_start: *code_start,
-                    })
-                }
-                InterpBlockState::AttachingBlockLevelCode { code_span, .. } => {
-                    return Err(InterpError::BlockOwnerCodeHasNoScope {
-                        code_span: *code_span,
-                    })
-                }
-            };
+    pub fn finalize(&mut self, py: Python, globals: &PyDict) -> InterpResult<()> {
+        let transitions = match &mut self.block_state {
+            InterpBlockState::ReadyForNewBlock => (None, None),
+            InterpBlockState::WritingPara(state) => state.finalize(py)?,
+            InterpBlockState::BuildingBlockLevelCode { code_start, .. } => {
+                return Err(InterpError::EndedInsideCode {
+                    code_start: *code_start,
+                })
+            }
+            InterpBlockState::AttachingBlockLevelCode { code_span, .. } => {
+                return Err(InterpError::BlockOwnerCodeHasNoScope {
+                    code_span: *code_span,
+                })
+            }
+        };
 
-            match self.block_stack.pop() {
-                // No open blocks on the stack => process the transition
-                None => self.handle_transition(py, globals, transitions),
-                Some(InterpBlockScopeState { scope_start, .. }) => {
-                    return Err(InterpError::EndedInsideScope { scope_start })
-                }
+        match self.block_stack.pop() {
+            // No open blocks on the stack => process the transition
+            None => self.handle_transition(py, globals, transitions),
+            Some(InterpBlockScopeState { scope_start, .. }) => {
+                return Err(InterpError::EndedInsideScope { scope_start })
             }
-        })
+        }
     }
 
     /// Return (block transition, special transition) to be executed in the order (block transition, special transition)
@@ -375,7 +367,7 @@ impl<'a> InterpState<'a> {
                 }
             }
             InterpBlockState::WritingPara(state) => {
-                dbg!(state.handle_token(py, globals, tok, self.data)?)
+                state.handle_token(py, globals, tok, self.data)?
             }
             InterpBlockState::BuildingBlockLevelCode {
                 code,
@@ -15,7 +15,9 @@ use super::{InlineNodeToCreate, InterpBlockTransition, InterpResult, InterpSpeci
 #[derive(Debug)]
 pub(crate) struct InterpParaState {
     para: Py<Paragraph>,
-    sentence: Py<Sentence>,
+    /// The sentence currently being built, created when the first node is pushed to it.
+    /// [None] if nothing has been pushed since the last sentence was finished.
+    sentence: Option<Py<Sentence>>,
     inline_stack: Vec<InterpInlineScopeState>,
     sentence_state: InterpSentenceState,
 }
@@ -157,7 +159,7 @@ impl InterpParaState {
         Ok(Self {
             sentence_state: InterpSentenceState::SentenceStart,
             para: Py::new(py, Paragraph::new(py))?,
-            sentence: Py::new(py, Sentence::new(py))?,
+            sentence: None,
             inline_stack: vec![],
         })
     }
@@ -224,8 +226,10 @@ impl InterpParaState {
             use InterpSentenceState as S;
 
             // All transitions interrupt the current Text token
-            if let S::BuildingText(text) = &self.sentence_state {
-                // Finish the text-in-progress and push to topmost scope
+            if let S::BuildingText(text) = &mut self.sentence_state {
+                // Finish the text-in-progress and push to topmost scope.
+                // The state is replaced below, so the text can be moved out instead of cloned.
+                let text = std::mem::take(text);
                 self.push_built_text_to_topmost_scope(py, text)?;
             }
 
@@ -250,7 +254,7 @@ impl InterpParaState {
                     T::PushInlineContent(content),
                 ) => {
                     let content = content.to_py(py)?;
-                    self.push_to_topmost_scope(py, content.as_ref(py))?;
+                    self.push_to_topmost_scope(py, &content)?;
                     (S::MidSentence, (None, None))
                 }
                 (S::MidSentence | S::BuildingText(_), T::BreakSentence) => {
@@ -258,15 +262,7 @@ impl InterpParaState {
                     self.check_inline_scopes_closed().map_err(|scope_start| {
                         InterpError::SentenceBreakInInlineScope { scope_start }
                     })?;
-                    // If the sentence has stuff in it, push it into the paragraph and make a new one
-                    if self.sentence.borrow(py).__len__(py) > 0 {
-                        self.para
-                            .borrow_mut(py)
-                            .push_sentence(self.sentence.as_ref(py))
-                            .err_as_interp_internal(py)?;
-                        self.sentence =
-                            Py::new(py, Sentence::new(py)).err_as_interp_internal(py)?;
-                    }
+                    self.finish_sentence(py)?;
                     (S::SentenceStart, (None, None))
                 }
 
@@ -289,7 +285,11 @@ impl InterpParaState {
                 (S::SentenceStart | S::MidSentence | S::BuildingText(_), T::PopInlineScope(_)) => {
                     let popped_scope = self.inline_stack.pop();
                     match popped_scope {
-                        Some(popped_scope) => self.push_to_topmost_scope(py, popped_scope.scope.as_ref(py))?,
+                        Some(popped_scope) => {
+                            // InlineScope is always an InlineNode
+                            let scope = PyTcRef::of_unchecked(popped_scope.scope.as_ref(py));
+                            self.push_to_topmost_scope(py, &scope)?
+                        }
                         None => {
                             return Err(InterpError::InternalErr("PopInlineScope attempted with no inline scopes - should use EndParagraphAndPopBlock in this case".into()))
                         }
@@ -346,15 +346,7 @@ impl InterpParaState {
                             return Err(InterpError::EndedInsideScope { scope_start });
                         }
                     }
-                    // If the sentence has stuff in it, push it into the paragraph and make a new one
-                    if self.sentence.borrow(py).__len__(py) > 0 {
-                        self.para
-                            .borrow_mut(py)
-                            .push_sentence(self.sentence.as_ref(py))
-                            .err_as_interp_internal(py)?;
-                        self.sentence =
-                            Py::new(py, Sentence::new(py)).err_as_interp_internal(py)?;
-                    }
+                    self.finish_sentence(py)?;
                     (
                         S::SentenceStart,
                         (Some(InterpBlockTransition::EndParagraph), None),
@@ -369,15 +361,7 @@ impl InterpParaState {
                     self.check_inline_scopes_closed().map_err(|_| {
                         InterpError::InternalErr("paragraph EndParagraphAndPopBlock transition invoked when inline scopes are still on the stack".into())
                     })?;
-                    // If the sentence has stuff in it, push it into the paragraph and make a new one
-                    if self.sentence.borrow(py).__len__(py) > 0 {
-                        self.para
-                            .borrow_mut(py)
-                            .push_sentence(self.sentence.as_ref(py))
-                            .err_as_interp_internal(py)?;
-                        self.sentence =
-                            Py::new(py, Sentence::new(py)).err_as_interp_internal(py)?;
-                    }
+                    self.finish_sentence(py)?;
                     (
                         S::SentenceStart,
                         (
@@ -430,7 +414,7 @@ impl InterpParaState {
                 RawScopeOpen(span, n) => Some(StartRawScope(None, span, n)),
 
                 CodeClose(span, _) => return Err(InterpError::CodeCloseOutsideCode(span)),
-                ScopeClose(span, n_hashes) => Some(self.try_pop_scope(py, span, n_hashes)?),
+                ScopeClose(span, n_hashes) => Some(self.try_pop_scope(span, n_hashes)?),
 
                 _ => Some(StartText(tok.stringify_escaped(data).into())),
             },
@@ -451,7 +435,7 @@ impl InterpParaState {
                 RawScopeOpen(span, n) => Some(StartRawScope(None, span, n)),
 
                 CodeClose(span, _) => return Err(InterpError::CodeCloseOutsideCode(span)),
-                ScopeClose(span, n_hashes) => Some(self.try_pop_scope(py, span, n_hashes)?),
+                ScopeClose(span, n_hashes) => Some(self.try_pop_scope(span, n_hashes)?),
 
                 _ => Some(StartText(tok.stringify_escaped(data).into())),
             },
@@ -472,7 +456,7 @@ impl InterpParaState {
                 RawScopeOpen(span, n) => Some(StartRawScope(None, span, n)),
 
                 CodeClose(span, _) => return Err(InterpError::CodeCloseOutsideCode(span)),
-                ScopeClose(span, n_hashes) => Some(self.try_pop_scope(py, span, n_hashes)?),
+                ScopeClose(span, n_hashes) => Some(self.try_pop_scope(span, n_hashes)?),
 
                 _ => {
                     text.push_str(tok.stringify_escaped(data));
@@ -527,8 +511,9 @@ impl InterpParaState {
                 expected_n_hashes,
                 ..
             } => match tok {
+                // PushInlineContent always leaves BuildingRawText, so move the owner/text out instead of cloning
                 ScopeClose(_, n) if n == *expected_n_hashes => Some(PushInlineContent(
-                    InlineNodeToCreate::RawText(owner.clone(), text.clone()),
+                    InlineNodeToCreate::RawText(owner.take(), std::mem::take(text)),
                 )),
                 _ => {
                     text.push_str(tok.stringify_raw(data));
@@ -540,8 +525,7 @@ impl InterpParaState {
     }
 
     fn try_pop_scope(
-        &mut self,
-        py: Python,
+        &self,
         scope_close_span: ParseSpan,
         n_hashes: usize,
     ) -> InterpResult<InterpParaTransition> {
@@ -562,23 +546,38 @@ impl InterpParaState {
                     })
                 }
             }
-            None => {
-                // If the sentence has stuff in it, push it into the paragraph and make a new one
-                if self.sentence.borrow(py).__len__(py) > 0 {
-                    self.para
-                        .borrow_mut(py)
-                        .push_sentence(self.sentence.as_ref(py))
-                        .err_as_interp_internal(py)?;
-                    self.sentence = Py::new(py, Sentence::new(py)).err_as_interp_internal(py)?;
-                }
-                Ok(InterpParaTransition::EndParagraphAndPopBlock(
-                    scope_close_span,
-                    n_hashes,
-                ))
-            }
+            // Don't finish the sentence here - in-progress text hasn't been pushed to it yet.
+            // The EndParagraphAndPopBlock transition pushes that text and then finishes the sentence.
+            None => Ok(InterpParaTransition::EndParagraphAndPopBlock(
+                scope_close_span,
+                n_hashes,
+            )),
         }
     }
 
+    /// If a sentence is in progress, push it into the paragraph.
+    ///
+    /// The next sentence isn't allocated until something is pushed to it,
+    /// so a paragraph ending after a sentence break doesn't create an empty one.
+    fn finish_sentence(&mut self, py: Python) -> InterpResult<()> {
+        if let Some(sentence) = self.sentence.take() {
+            self.para
+                .borrow_mut(py)
+                .push_sentence(sentence.as_ref(py))
+                .err_as_interp_internal(py)?;
+        }
+        Ok(())
+    }
+
+    /// Get the sentence in progress, creating it if nothing has been pushed to it yet
+    fn current_sentence(&mut self, py: Python) -> PyResult<&Py<Sentence>> {
+        let sentence = match self.sentence.take() {
+            Some(sentence) => sentence,
+            None => Py::new(py, Sentence::new(py))?,
+        };
+        Ok(self.sentence.insert(sentence))
+    }
+
     /// Check if all inline scopes are closed, returning [Err] of [ParseSpan] of the closest open inline scope if not.
     fn check_inline_scopes_closed(&self) -> Result<(), ParseSpan> {
         if let Some(i) = self.inline_stack.last() {
@@ -588,16 +587,23 @@ impl InterpParaState {
         }
     }
 
-    fn push_to_topmost_scope(&self, py: Python, node: &PyAny) -> InterpResult<()> {
+    /// Push a node, which has already been checked to be an [InlineNode], to the topmost scope
+    fn push_to_topmost_scope(
+        &mut self,
+        py: Python,
+        node: &PyTcRef<InlineNode>,
+    ) -> InterpResult<()> {
         match self.inline_stack.last() {
-            Some(i) => i.scope.borrow_mut(py).push_node(node),
-            None => self.sentence.borrow_mut(py).push_node(node),
+            Some(i) => i.scope.borrow_mut(py).push_tc_node(py, node),
+            None => self
+                .current_sentence(py)
+                .and_then(|sentence| sentence.borrow_mut(py).push_tc_node(py, node)),
         }
         .err_as_interp_internal(py)
     }
 
-    fn push_built_text_to_topmost_scope(&self, py: Python, text: &String) -> InterpResult<()> {
-        let node = InlineNodeToCreate::UnescapedText(text.clone()).to_py(py)?;
-        self.push_to_topmost_scope(py, node.as_ref(py))
+    fn push_built_text_to_topmost_scope(&mut self, py: Python, text: String) -> InterpResult<()> {
+        let node = InlineNodeToCreate::UnescapedText(text).to_py(py)?;
+        self.push_to_topmost_scope(py, &node)
     }
 }
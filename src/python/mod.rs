@@ -69,9 +69,20 @@ pub fn interp_data(
     data: &str,
     toks: impl Iterator<Item = TTToken>,
 ) -> InterpResult<Py<BlockScope>> {
-    let mut st = InterpState::new(ttpython, data)?;
-    let res: InterpResult<()> = toks.map(|t| st.handle_token(ttpython, t)).collect();
-    res?;
-    st.finalize(ttpython)?;
-    Ok(st.root())
+    // Hold the GIL for the whole document, instead of re-acquiring it for every token
+    ttpython.with_gil(|py, globals| {
+        let mut st = InterpState::new(py, data)?;
+        for t in toks {
+            // Give each token its own GILPool, so owned references created while handling it
+            // (eval results, str() temporaries in typeclass checks, new lists/strings)
+            // are released after the token instead of piling up until the document is finished.
+            // SAFETY: no reference obtained through the pool's `py` outlives this loop iteration,
+            // InterpState only stores owned Py<T>/PyObject handles.
+            let pool = unsafe { py.new_pool() };
+            let py = pool.python();
+            st.handle_token(py, globals, t)?;
+        }
+        st.finalize(py, globals)?;
+        Ok(st.root())
+    })
 }
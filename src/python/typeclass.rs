@@ -32,6 +32,25 @@ impl<T: PyTypeclass> PyTcRef<T> {
         }
     }
 
+    /// Like [Self::of], but returns `Ok(None)` if the value doesn't fit the typeclass.
+    ///
+    /// Use this where not fitting is an expected outcome, so no [PyTypeError] is created just to be discarded.
+    pub fn try_of(val: &PyAny) -> PyResult<Option<Self>> {
+        if T::fits_typeclass(val)? {
+            Ok(Some(Self(val.into(), PhantomData::default())))
+        } else {
+            Ok(None)
+        }
+    }
+
+    /// Wrap a value without calling [PyTypeclass::fits_typeclass].
+    ///
+    /// Only for values whose Rust type already guarantees they fit the typeclass,
+    /// e.g. a freshly created [super::interop::UnescapedText] for [super::interop::InlineNode].
+    pub(crate) fn of_unchecked(val: &PyAny) -> Self {
+        Self(val.into(), PhantomData::default())
+    }
+
     pub fn as_ref<'py>(&'py self, py: Python<'py>) -> &'py PyAny {
         self.0.as_ref(py)
     }
@@ -59,6 +78,12 @@ impl<T: PyTypeclass> PyTypeclassList<T> {
         }
     }
 
+    /// Append a value which has already been checked against the typeclass (by [PyTcRef::of]),
+    /// skipping the second [PyTypeclass::fits_typeclass] call [Self::append_checked] would make.
+    pub fn append_tc(&self, py: Python, val: &PyTcRef<T>) -> PyResult<()> {
+        self.0.as_ref(py).append(val.as_ref(py))
+    }
+
     pub fn list<'py>(&'py self, py: Python<'py>) -> &'py PyList {
         self.0.as_ref(py)
     }
@@ -310,7 +310,7 @@ fn expect_tokens<'a>(
         .iter(&[Box::new(Unit::parse_special), Box::new(Unit::parse_other)])
         .scan((), |_, x| x.ok())
         .collect();
-    let stoks = units_to_tokens(units);
+    let stoks: Vec<TTToken> = units_to_tokens(units).collect();
     let stok_types: Vec<TestTTToken> = stoks
         .iter()
         .map(|stok| TestTTToken::from_str_tok(data, *stok))
@@ -524,6 +524,61 @@ Second paragraph inside the scope
     )
 }
 
+#[test]
+pub fn test_block_scope_closed_mid_sentence() {
+    expect_tokens(
+        "{\nsome {inline} text}",
+        vec![
+            BlockScopeOpen(0),
+            OtherText("some "),
+            InlineScopeOpen(0),
+            OtherText("inline"),
+            ScopeClose(0),
+            OtherText(" text"),
+            ScopeClose(0),
+        ],
+        Ok(test_doc(vec![TestBlock::BlockScope {
+            owner: None,
+            contents: vec![TestBlock::Paragraph(vec![vec![
+                test_text("some "),
+                TestInline::InlineScope {
+                    owner: None,
+                    contents: vec![test_text("inline")],
+                },
+                test_text(" text"),
+            ]])],
+        }])),
+    )
+}
+
+#[test]
+pub fn test_block_scope_with_hashes() {
+    // Hashes + ScopeOpen + Newline are combined into a single three-unit token
+    expect_tokens(
+        "##{\ntext\n}##",
+        vec![BlockScopeOpen(2), OtherText("text"), Newline, ScopeClose(2)],
+        Ok(test_doc(vec![TestBlock::BlockScope {
+            owner: None,
+            contents: vec![TestBlock::Paragraph(vec![test_sentence("text")])],
+        }])),
+    )
+}
+
+#[test]
+pub fn test_block_scope_open_at_end_of_stream() {
+    // The three-unit token uses up the final unit, so the lookahead is refilled from an exhausted stream
+    expect_tokens(
+        "##{\n",
+        vec![BlockScopeOpen(2)],
+        Err(TestInterpError::EndedInsideScope {
+            scope_start: TestParserSpan {
+                start: (1, 1),
+                end: (2, 1),
+            },
+        }),
+    )
+}
+
 #[test]
 pub fn test_raw_scope() {
     expect_tokens(
@@ -1058,3 +1113,29 @@ import os
         ]])])),
     )
 }
+
+#[test]
+pub fn test_eval_plain_value() {
+    expect_tokens(
+        "[None]",
+        vec![CodeOpen(0), OtherText("None"), CodeClose(0)],
+        Ok(test_doc(vec![TestBlock::Paragraph(vec![vec![test_text(
+            "None",
+        )]])])),
+    )
+}
+
+#[test]
+pub fn test_eval_value_with_unencodable_str() {
+    // A lone surrogate can't be converted to UTF-8, so checking it for "TestInlineScope" etc. fails.
+    // It should still be treated as plain text instead of raising an error.
+    // The test conversion uses Display => to_string_lossy, which turns each of the surrogate's three
+    // (surrogatepass-encoded) bytes into U+FFFD
+    expect_tokens(
+        "[chr(0xd800)]",
+        vec![CodeOpen(0), OtherText("chr(0xd800)"), CodeClose(0)],
+        Ok(test_doc(vec![TestBlock::Paragraph(vec![test_sentence(
+            "\u{FFFD}\u{FFFD}\u{FFFD}",
+        )])])),
+    )
+}